@@ -1 +1,16 @@
-from .spark import *
+from .spark import (  # noqa: F401
+    STYLES,
+    AbstractStyle,
+    ArrowsStyle,
+    AsciiStyle,
+    BlockStyle,
+    BrailleStyle,
+    DefaultStyle,
+    MultiLineGraphStyle,
+    NumericStyle,
+    get_args,
+    get_style_instance,
+    main,
+    print_ansi_spark,
+    print_stats,
+)
@@ -19,9 +19,61 @@ Example usage:
     python3 this_file.py 1.0 2.5 3.3 4.7 3.5 --ticks="block" --stats
 """
 import argparse
+import functools
 import statistics
 
 
+def _minmax(data):
+    """
+    Find the minimum and maximum of the given data in a single pass.
+
+    Args:
+        data (iterable): Numerical data.
+
+    Returns:
+        tuple: The minimum and maximum values.
+
+    Raises:
+        ValueError: If data is empty.
+    """
+    iterator = iter(data)
+    try:
+        min_data = max_data = next(iterator)
+    except StopIteration:
+        raise ValueError("_minmax() arg is an empty sequence") from None
+    for value in iterator:
+        if value < min_data:
+            min_data = value
+        elif value > max_data:
+            max_data = value
+    return min_data, max_data
+
+
+def _numeric_minmax(data):
+    """
+    Find the minimum and maximum of the given data in a single pass, checking each point is numeric.
+
+    Args:
+        data (list): A non-empty list of data points.
+
+    Returns:
+        tuple: The minimum and maximum values.
+
+    Raises:
+        ValueError: If any data point is not an int or float.
+    """
+    numeric = (int, float)
+    min_data = max_data = data[0]
+    for value in data:
+        if not isinstance(value, numeric):
+            raise ValueError("All data points should be numeric")
+        if value < min_data:
+            min_data = value
+        elif value > max_data:
+            max_data = value
+    return min_data, max_data
+
+
 def print_stats(data):
     """
     Compute and format basic statistics from the given data.
@@ -35,12 +87,10 @@ def print_stats(data):
     if not data or len(data) < 2:
         raise ValueError("At least two data points are required to compute statistics")
 
-    if not all(isinstance(item, (int, float)) for item in data):
-        raise ValueError("All data points should be numeric")
-
-    min_data = min(data)
-    max_data = max(data)
+    min_data, max_data = _numeric_minmax(data)
 
+    # statistics.mean/stdev are correctly rounded; faster float forms such as
+    # math.fsum(data) / n round twice and change the printed repr for ordinary inputs.
     stats_str = (
         f"Minimum: {min_data}\n"
         f"Maximum: {max_data}\n"
@@ -70,6 +120,20 @@ class AbstractStyle:
         """
         raise NotImplementedError
 
+    def scale_data_verbose(self, data):
+        """
+        Scale data and describe each resulting symbol, for the CLI's --verbose output.
+
+        Styles without a verbose representation return the plain scaled data.
+
+        Args:
+            data (list): A list of numerical data.
+
+        Returns:
+            list: A list of symbols or descriptions representing the scaled data.
+        """
+        return self.scale_data(data)
+
 
 class ArrowsStyle(AbstractStyle):
     """
@@ -79,15 +143,12 @@ class ArrowsStyle(AbstractStyle):
     TICKS = ("↓", "→", "↗", "↑")
 
     def scale_data(self, data, verbose=False):
-        result = [self.TICKS[1]]  # Assumes no change at start
-        for i in range(1, len(data)):
-            if data[i] > data[i - 1]:
-                result.append(self.TICKS[3])  # up arrow
-            elif data[i] < data[i - 1]:
-                result.append(self.TICKS[0])  # down arrow
-            else:
-                result.append(self.TICKS[1])  # right arrow for no change
-        return result
+        down, flat, _, up = self.TICKS
+        # Assumes no change at start; right arrow for no change
+        return [flat] + [
+            up if current > previous else down if current < previous else flat
+            for previous, current in zip(data, data[1:])
+        ]
 
 
 class DefaultStyle(AbstractStyle):
@@ -98,13 +159,17 @@ class DefaultStyle(AbstractStyle):
     TICKS = ("▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
 
     def scale_data(self, data, verbose=False):
-        min_data = min(data)
-        range_data = (max(data) - min_data) / (len(self.TICKS) - 1)
+        if verbose:
+            return self.scale_data_verbose(data)
+        ticks = self.TICKS
+        min_data, max_data = _minmax(data)
+        range_data = (max_data - min_data) / (len(ticks) - 1)
         if range_data == 0:
-            return [self.TICKS[0] for _ in data]
-        else:
-            scaled_data = [self.TICKS[int(round((value - min_data) / range_data))] for value in data]
-            return self.verbose_output(scaled_data) if verbose else scaled_data
+            return [ticks[0]] * len(data)
+        return [ticks[round((value - min_data) / range_data)] for value in data]
+
+    def scale_data_verbose(self, data):
+        return self.verbose_output(self.scale_data(data))
 
     @staticmethod
     def verbose_output(scaled_data):
@@ -158,25 +223,20 @@ class MultiLineGraphStyle(AbstractStyle):
     """
 
     def scale_data(self, data, verbose=False):
-        min_data = min(data)
-        max_data = max(data)
+        min_data, max_data = _minmax(data)
         range_data = max_data - min_data
         graph_height = 10  # Set graph height to 10 lines for better visibility
 
         if range_data == 0:
             return [["─" * len(data)] * graph_height]  # Uniform line if no variation
 
-        scaled_data = [int((value - min_data) / range_data * (graph_height - 1)) for value in data]
+        top = graph_height - 1
+        scaled_data = [int((value - min_data) / range_data * top) for value in data]
 
-        # Initialize the graph canvas
-        graph = [[" " for _ in range(len(data))] for _ in range(graph_height)]
-
-        # Place the points on the graph
-        for idx, height in enumerate(scaled_data):
-            for y in range(graph_height):
-                graph[y][idx] = "█" if y >= graph_height - height else " "
-
-        return graph
+        # Every column is one of graph_height bars (blanks above, blocks below), so draw each
+        # bar once, pick one per column, and transpose the columns into rows
+        bars = [" " * (graph_height - height) + "█" * height for height in range(graph_height)]
+        return [list(row) for row in zip(*[bars[height] for height in scaled_data])]
 
     def __str__(self):
         return "Multiline Graph Style"
@@ -202,25 +262,27 @@ def print_ansi_spark(data_points, verbose=False, style=None):
         verbose (bool): Whether to print verbose output.
         style (str): The style of the graph, which could influence formatting details.
     """
+    # Build the whole output first so it reaches stdout in a single write.
     if isinstance(data_points[0], list):
         if verbose:
-            for index, line in enumerate(data_points):
-                print(f"Line {index+1}: {''.join(line)}")
+            lines = [f"Line {index+1}: {''.join(line)}" for index, line in enumerate(data_points)]
         else:
-            for line in data_points:
-                print("".join(line))
+            lines = ["".join(line) for line in data_points]
     else:
         if verbose:
-            for index, point in enumerate(data_points):
-                print(f"Point {index+1}: {point}")
+            lines = [f"Point {index+1}: {point}" for index, point in enumerate(data_points)]
         else:
-            print("".join(data_points))
+            lines = ["".join(data_points)]
+    print("\n".join(lines))
 
 
+@functools.lru_cache(maxsize=None)
 def get_style_instance(style):
     """
     Returns an instance of the appropriate style class based on the given style name.
 
+    Style instances hold no per-call state, so one shared instance is cached per style name.
+
     Args:
         style (str): The name of the style to use.
 
@@ -276,7 +338,10 @@ def main():
     """
     args = get_args()
     style_instance = get_style_instance(args.ticks)
-    scaled_data = style_instance.scale_data(args.numbers, verbose=args.verbose)
+    if args.verbose:
+        scaled_data = style_instance.scale_data_verbose(args.numbers)
+    else:
+        scaled_data = style_instance.scale_data(args.numbers)
 
     if args.stats:
         print(print_stats(args.numbers))
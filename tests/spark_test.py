@@ -2,6 +2,10 @@
 # pylint: skip-file
 # mypy: ignore-errors
 
+import statistics
+
+import pytest
+
 import sparkback.spark as spark
 
 
@@ -30,3 +34,96 @@ def test_print_stats():
     data = [1, 2, 3, 4, 5, 6, 7, 8]
     expected_output = "Minimum: 1\nMaximum: 8\nMean: 4.5\nStandard Deviation: 2.449489742783178"
     assert spark.print_stats(data) == expected_output
+
+
+def test_print_stats_floats():
+    data = [80.2, 6.3, 11.8, 76.1, 47.2, 38.0]
+    expected_output = (
+        "Minimum: 6.3\n"
+        "Maximum: 80.2\n"
+        f"Mean: {statistics.mean(data)}\n"
+        f"Standard Deviation: {statistics.stdev(data)}"
+    )
+    assert spark.print_stats(data) == expected_output
+    assert "Mean: 43.266666666666666\n" in spark.print_stats(data)
+
+
+def test_print_stats_ints():
+    data = [1, 2, 3]
+    expected_output = "Minimum: 1\nMaximum: 3\nMean: 2\nStandard Deviation: 1.0"
+    assert spark.print_stats(data) == expected_output
+
+
+def test_print_stats_wide_magnitudes():
+    data = [1e16, 1, -1e16, 1]
+    assert f"Mean: {statistics.mean(data)}\n" in spark.print_stats(data)
+    assert "Mean: 0.5\n" in spark.print_stats(data)
+
+
+def test_print_stats_mean_is_correctly_rounded():
+    # math.fsum(data) / len(data) gives 56.26666666666667 here.
+    data = [82.4, 26.9, 59.5]
+    assert "Mean: 56.266666666666666\n" in spark.print_stats(data)
+
+
+def test_scale_data_constant():
+    data = [3, 3, 3, 3]
+    style_instance = spark.DefaultStyle()
+    expected_output = ["▁", "▁", "▁", "▁"]
+    assert style_instance.scale_data(data) == expected_output
+
+
+def test_get_style_instance_is_cached():
+    assert spark.get_style_instance("block") is spark.get_style_instance("block")
+    assert isinstance(spark.get_style_instance("block"), spark.BlockStyle)
+
+
+def test_get_style_instance_invalid():
+    with pytest.raises(ValueError):
+        spark.get_style_instance("nope")
+
+
+def test_print_ansi_spark_multiline(capsys):
+    spark.print_ansi_spark([["a", "b"], ["c", "d"]])
+    assert capsys.readouterr().out == "ab\ncd\n"
+
+
+def test_print_ansi_spark_verbose(capsys):
+    spark.print_ansi_spark(["▁", "█"], verbose=True)
+    assert capsys.readouterr().out == "Point 1: ▁\nPoint 2: █\n"
+
+
+def test_scale_data_verbose():
+    data = [1, 8]
+    style_instance = spark.DefaultStyle()
+    expected_output = ["Data point 0 is ▁.", "Data point 1 is █."]
+    assert style_instance.scale_data_verbose(data) == expected_output
+    assert style_instance.scale_data(data, verbose=True) == expected_output
+
+
+def test_minmax():
+    assert spark._minmax([3, 1, 4, 1, 5, 9, 2, 6]) == (1, 9)
+    with pytest.raises(ValueError):
+        spark._minmax([])
+
+
+def test_scale_data_half_bucket_rounding():
+    # 9 lands on a half-bucket boundary; dividing by the bucket width keeps it in "▄", not "▅".
+    data = [0, 9, 18]
+    style_instance = spark.DefaultStyle()
+    expected_output = ["▁", "▄", "█"]
+    assert style_instance.scale_data(data) == expected_output
+
+
+def test_scale_data_multiline():
+    data = [0, 9, 4.5]
+    graph = spark.MultiLineGraphStyle().scale_data(data)
+    assert len(graph) == 10
+    assert ["".join(row) for row in graph] == [" " * 3] + [" █ "] * 5 + [" ██"] * 4
+
+
+def test_print_stats_non_numeric():
+    with pytest.raises(ValueError):
+        spark.print_stats([1, 2, "3"])
+    with pytest.raises(ValueError):
+        spark.print_stats(["1", 2, 3])